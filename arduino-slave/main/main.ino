@@ -304,6 +304,7 @@ class ShuttersManager {
    @note 8 = OPEN_SHUTTERS
    @note 16 = CLOSE_SHUTTERS
    @note 32 = SEND_INFOS
+   @note Several orders can be sent in one transmission, separated by ";" (e.g. "32;8\r\n"): parseInt stops at the separator and the next order is read at the next loop.
    @returns {int} The command's code.
 */
 int receiveOrder() {